@@ -1,2 +1,2 @@
 """phone_finder package"""
-__all__ = ["lookup", "cli", "web"]
+__all__ = ["lookup", "cache", "cli", "web"]
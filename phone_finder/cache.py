@@ -0,0 +1,95 @@
+"""Caches for external lookup results."""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "phone_finder", "lookups.sqlite")
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class ResponseCache:
+    """Persistent (provider, normalized number) -> lookup result store with a TTL.
+
+    Only answered lookups are stored, including "no match" answers, so repeated
+    queries for the same number don't re-hit paid or rate-limited APIs. The cache
+    is best effort: database errors (e.g. a locked file) read as a miss and skip
+    the write rather than failing the lookup.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # lookups run on worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "provider TEXT NOT NULL, number TEXT NOT NULL, value TEXT, expires REAL NOT NULL, "
+                "PRIMARY KEY (provider, number))"
+            )
+
+    def get(self, provider: str, number: str) -> Optional[Tuple[bool, Optional[str]]]:
+        """Return the cached (success, value) result, or None on a miss or expired entry."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires FROM lookups WHERE provider = ? AND number = ?", (provider, number)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or row[1] < time.time():
+            return None
+        return True, row[0]
+
+    def set(self, provider: str, number: str, value: Optional[str]) -> None:
+        """Store an answered lookup for ``ttl`` seconds."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups (provider, number, value, expires) VALUES (?, ?, ?, ?)",
+                    (provider, number, value, time.time() + self.ttl),
+                )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire ``ttl`` seconds after being set.
+
+    When more than ``maxsize`` entries are held the oldest are evicted first.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            # re-insert so insertion order stays expiry order
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -1,10 +1,25 @@
 """Simple CLI for phone number -> name lookup."""
 import argparse
 import os
+import sqlite3
 import sys
 from typing import Optional
 
-from .lookup import load_contacts_csv, find_name_local, ExternalLookup, get_number_info
+from .cache import ResponseCache
+from .lookup import load_contacts_csv, find_name_local, find_name_streaming, ExternalLookup, get_number_info, normalize_number, parse_number, PAID_PROVIDERS
+
+
+# External providers, highest priority first:
+# (lookup name, CLI flag, env vars that must all be set, output line for a hit).
+PROVIDERS = (
+    ("opencorporates", "use_opencorporates", (), "Found company via OpenCorporates: {}"),
+    ("yelp", "use_yelp", ("YELP_API_KEY",), "Found business via Yelp: {}"),
+    ("twilio", "use_twilio", ("TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN"), "Found via Twilio: {}"),
+    ("numverify", "use_numverify", ("NUMVERIFY_API_KEY",), "External lookup hint: {}"),
+)
+
+# Number metadata fields printed when nothing matched, in display order.
+INFO_FIELDS = ("normalized", "is_valid", "is_possible", "region", "description", "carrier", "line_type", "timezones")
 
 
 def main(argv: Optional[list] = None) -> int:
@@ -12,101 +27,90 @@ def main(argv: Optional[list] = None) -> int:
     parser.add_argument("--number", required=True, help="Phone number to lookup")
     parser.add_argument("--contacts", default=None, help="Path to CSV contacts (name,phone). If omitted no local contacts will be used.")
     parser.add_argument("--region", default="US", help="Default region for parsing numbers (e.g. US, GB)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes used to parse the contacts CSV (0 = one per CPU)")
     parser.add_argument("--use-numverify", action="store_true", help="Attempt a NumVerify lookup if NUMVERIFY_API_KEY is set")
     parser.add_argument("--use-twilio", action="store_true", help="Attempt a Twilio Lookup (caller-name) if TWILIO_ACCOUNT_SID/TWILIO_AUTH_TOKEN are set")
     parser.add_argument("--use-yelp", action="store_true", help="Attempt a Yelp business lookup if YELP_API_KEY is set")
     # Google Places removed by user preference
     parser.add_argument("--use-opencorporates", action="store_true", help="Attempt an OpenCorporates company lookup if OPENCORPORATES_API_KEY is set")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or store external lookup results in the on-disk cache")
     args = parser.parse_args(argv)
 
-    contacts = {}
+    # Parse the query once and share it between the local match, the external
+    # providers and the metadata lookup.
+    try:
+        number = parse_number(args.number, default_region=args.region)
+        normalized = normalize_number(args.number, default_region=args.region)
+    except ValueError as e:
+        # report the parser's own reason, as the CLI always has
+        print(f"Could not parse number: {e.__cause__ or e}")
+        return 2
+
+    requested = [(name, env_vars) for name, flag, env_vars, _ in PROVIDERS if getattr(args, flag)]
+    ext = None
+    configured = []
+    early = []
+    external = None
+    if requested:
+        # providers missing credentials can't answer, so don't spend a request on them
+        configured = [name for name, env_vars in requested if all(os.environ.get(var) for var in env_vars)]
+        cache = None
+        if not args.no_cache:
+            try:
+                cache = ResponseCache()
+            except (OSError, sqlite3.Error):
+                # an unwritable cache location shouldn't stop the lookup
+                cache = None
+        ext = ExternalLookup(
+            numverify_key=os.environ.get("NUMVERIFY_API_KEY"),
+            twilio_sid=os.environ.get("TWILIO_ACCOUNT_SID"),
+            twilio_token=os.environ.get("TWILIO_AUTH_TOKEN"),
+            cache=cache,
+        )
+        if args.contacts:
+            # Start the free providers now so their network time overlaps with scanning
+            # the contacts file. They run on daemon threads, so a local hit exits at once.
+            early = [name for name in configured if name not in PAID_PROVIDERS]
+            if early:
+                external = ext.lookup_all_in_background(normalized, args.region, early)
+
+    # Try local contacts only if provided
     if args.contacts:
         try:
-            contacts = load_contacts_csv(args.contacts, default_region=args.region)
+            if args.jobs == 1:
+                # stream the file so a single query doesn't hold every contact in memory;
+                # it still normalizes every row, so it is no faster than a full load
+                name = find_name_streaming(number, args.contacts, default_region=args.region)
+            else:
+                contacts = load_contacts_csv(args.contacts, default_region=args.region, jobs=args.jobs or None)
+                name = find_name_local(number, contacts, default_region=args.region)
         except FileNotFoundError:
             print(f"Contacts file not found: {args.contacts}")
             return 2
-
-    # Try local contacts only if provided
-    if contacts:
-        name = find_name_local(args.number, contacts, default_region=args.region)
         if name:
             print(f"Found locally: {name}")
             return 0
 
-    if args.use_twilio:
-        sid = os.environ.get("TWILIO_ACCOUNT_SID")
-        token = os.environ.get("TWILIO_AUTH_TOKEN")
-        ext = ExternalLookup(twilio_sid=sid, twilio_token=token)
-        ok, name = ext.lookup_twilio(args.number, default_region=args.region)
-        if ok and name:
-            print(f"Found via Twilio: {name}")
+    if ext is not None:
+        # the highest-priority hit wins; the free providers started early outrank the paid ones
+        provider = value = None
+        if external is not None:
+            provider, _, value = external.result()
+        remaining = [name for name in configured if name not in early]
+        if not provider and remaining:
+            provider, _, value = ext.lookup_all(normalized, args.region, remaining)
+        if provider:
+            messages = {name: message for name, _, _, message in PROVIDERS}
+            print(messages[provider].format(value))
             return 0
-        elif ok and name is None:
-            print("Twilio lookup returned no caller name for this number.")
-            return 1
-        else:
-            # fallback to NumVerify if requested
-            if args.use_numverify:
-                key = os.environ.get("NUMVERIFY_API_KEY")
-                ext = ExternalLookup(numverify_key=key, twilio_sid=sid, twilio_token=token)
-                ok, hint = ext.lookup_numverify(args.number, default_region=args.region)
-                if ok and hint:
-                    print(f"External lookup hint: {hint}")
-                    return 0
-            print("External lookup attempted but returned no identifying information.")
-            return 1
-
-    if args.use_yelp:
-        api_key = os.environ.get("YELP_API_KEY")
-        ext = ExternalLookup()
-        ok, name = ext.lookup_yelp(args.number, default_region=args.region)
-        if ok and name:
-            print(f"Found business via Yelp: {name}")
-            return 0
-        elif ok and name is None:
-            print("Yelp lookup returned no business for this number.")
-            return 1
-        else:
-            print("Yelp lookup failed or was not available.")
-            return 1
-
-    # Google Places lookup removed per user preference
-
-    if args.use_opencorporates:
-        api_key = os.environ.get("OPENCORPORATES_API_KEY")
-        ext = ExternalLookup()
-        ok, name = ext.lookup_opencorporates(args.number, default_region=args.region)
-        if ok and name:
-            print(f"Found company via OpenCorporates: {name}")
-            return 0
-        elif ok and name is None:
-            print("OpenCorporates lookup returned no company for this number.")
-            return 1
-        else:
-            print("OpenCorporates lookup failed or was not available.")
-            return 1
-
-    if args.use_numverify:
-        key = os.environ.get("NUMVERIFY_API_KEY")
-        ext = ExternalLookup(numverify_key=key)
-        ok, hint = ext.lookup_numverify(args.number, default_region=args.region)
-        if ok and hint:
-            print(f"External lookup hint: {hint}")
-            return 0
-        else:
-            print("External lookup attempted but returned no identifying information.")
-            return 1
+        print("External lookup attempted but returned no identifying information.")
+        return 1
 
     # No external provider requested: show free metadata about the number
-    info = get_number_info(args.number, default_region=args.region)
-    if "error" in info:
-        print(f"Could not parse number: {info['error']}")
-        return 2
-
+    info = get_number_info(number, default_region=args.region)
     print("No match found in local contacts.")
     print("Number info:")
-    for k in ("normalized", "is_valid", "is_possible", "region", "description", "carrier", "line_type", "timezones"):
+    for k in INFO_FIELDS:
         if k in info and info[k] is not None:
             print(f"  {k}: {info[k]}")
     return 1
@@ -1,62 +1,493 @@
 import csv
+import io
+import mmap
 import os
-from typing import Dict, Optional, Tuple
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache, wraps
+from itertools import chain, islice, repeat
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Pattern, Tuple, Union
+from urllib.parse import urlsplit
 
 import phonenumbers
-from phonenumbers import PhoneNumberFormat, NumberParseException
-from phonenumbers import carrier as _carrier
-from phonenumbers import geocoder as _geocoder
-from phonenumbers import timezone as _timezone
-import requests
+from phonenumbers import PhoneNumber, PhoneNumberFormat, NumberParseException
+
+from .cache import ResponseCache, TTLCache
+
+if TYPE_CHECKING:
+    import requests
+
+# Read buffer used when streaming contact CSVs (1 MiB).
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Rows handed to each normalization task when loading contacts.
+_CHUNK_ROWS = 50_000
+
+# Input already in E.164 form: "+" followed by 7-15 digits.
+_E164_RE = re.compile(r"^\+[1-9][0-9]{6,14}$")
+
+# Regions sharing country code 1, where national numbers map directly onto E.164.
+_NANP_REGIONS = frozenset(phonenumbers.COUNTRY_CODE_TO_REGION_CODE[1])
+
+# Deletes the punctuation commonly used to format phone numbers.
+_STRIP_SEPARATORS = str.maketrans("", "", " ()-.\u00a0")
+
+# phonenumbers.parse rejects any input with fewer digits than this (its minimum
+# national number length), so such rows can be dropped without parsing.
+_MIN_PARSEABLE_DIGITS = 2
+
+# Contact lists larger than this are stored as a CompactContacts instead of a dict.
+_COMPACT_THRESHOLD = 1_000_000
+# Largest number CompactContacts can pack into its unsigned 64-bit array.
+_MAX_PACKED_NUMBER = (1 << 64) - 1
+
+# Readable names for phonenumbers.PhoneNumberType values.
+_PHONE_TYPE_NAMES = {
+    phonenumbers.PhoneNumberType.FIXED_LINE: "FIXED_LINE",
+    phonenumbers.PhoneNumberType.MOBILE: "MOBILE",
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "FIXED_LINE_OR_MOBILE",
+    phonenumbers.PhoneNumberType.TOLL_FREE: "TOLL_FREE",
+    phonenumbers.PhoneNumberType.PREMIUM_RATE: "PREMIUM_RATE",
+    phonenumbers.PhoneNumberType.SHARED_COST: "SHARED_COST",
+    phonenumbers.PhoneNumberType.VOIP: "VOIP",
+    phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "PERSONAL_NUMBER",
+    phonenumbers.PhoneNumberType.PAGER: "PAGER",
+    phonenumbers.PhoneNumberType.UAN: "UAN",
+    phonenumbers.PhoneNumberType.VOICEMAIL: "VOICEMAIL",
+    phonenumbers.PhoneNumberType.UNKNOWN: "UNKNOWN",
+}
+
+# External providers understood by ExternalLookup.lookup_all, highest priority first.
+PROVIDER_PRIORITY = ("opencorporates", "google", "yelp", "twilio", "numverify")
+
+# Providers that bill per request. They rank below every free provider, so callers
+# can query the free ones first and only pay when those found nothing.
+PAID_PROVIDERS = ("twilio", "numverify")
+
+# Requests allowed per second for each provider host; conservative so batch use
+# stays under the providers' published limits instead of bouncing off 429s.
+_RATE_LIMITS = {
+    "apilayer.net": 5,
+    "lookups.twilio.com": 10,
+    "api.yelp.com": 5,
+    "maps.googleapis.com": 10,
+    "api.opencorporates.com": 2,
+}
+_DEFAULT_RATE_LIMIT = 5
+
+# Threads each ExternalLookup may use for concurrent provider requests.
+_LOOKUP_WORKERS = 16
+
+# Statuses retried for provider requests (throttled or failing). Each retry waits
+# on the host's rate limiter, backs off exponentially and honours a Retry-After of
+# up to _MAX_RETRY_AFTER seconds; a longer one ends the attempt, so a throttled
+# provider reads as a miss instead of stalling a web request.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_STATUS_RETRIES = 2
+_RETRY_BACKOFF = 0.3
+_MAX_RETRY_AFTER = 1.0
+
+
+@lru_cache(maxsize=None)
+def _country_prefix(leading_digits: str) -> Optional[Tuple[int, Optional[Pattern]]]:
+    """Resolve the first three digits of an E.164 number to its country code.
+
+    Returns (country code length, compiled national-prefix-for-parsing pattern or
+    None), or None for an unknown country code. Country codes are prefix-free and
+    at most three digits, so this is memoized per leading-digit prefix and the
+    phonenumbers metadata is consulted at most once for each.
+    """
+    for length in (1, 2, 3):
+        country_code = int(leading_digits[:length])
+        if country_code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE:
+            break
+    else:
+        return None
+    region = phonenumbers.region_code_for_country_code(country_code)
+    metadata = phonenumbers.PhoneMetadata.metadata_for_region_or_calling_code(country_code, region)
+    if metadata is None or not metadata.national_prefix_for_parsing:
+        return length, None
+    return length, re.compile(metadata.national_prefix_for_parsing)
 
 
-def normalize_number(number: str, default_region: str = "US") -> str:
-    """Parse and return an E.164 formatted phone number.
+def _fast_e164(number: str) -> Optional[str]:
+    """Return ``number`` as-is if it is already the E.164 string phonenumbers would produce.
+
+    Returns None when the full parser is needed: unknown country codes, and national
+    numbers starting with a trunk prefix (e.g. "+44020...") which phonenumbers strips.
+    """
+    if not _E164_RE.match(number):
+        return None
+    country = _country_prefix(number[1:4])
+    if country is None:
+        return None
+    length, prefix = country
+    national = number[1 + length:]
+    if national.startswith("0"):
+        return None
+    if prefix is not None:
+        match = prefix.match(national)
+        if match and match.end():
+            return None
+    return number
 
+
+def _fast_normalize(number: str, region: str) -> Optional[str]:
+    """Normalize the common contact-list shapes without phonenumbers.parse.
+
+    Handles "+<digits>" and, for NANP regions, 10-digit national numbers (optionally
+    with a leading 1), written with the usual separators. Returns None when the
+    full parser is needed.
+    """
+    return _fast_normalize_cleaned(number.translate(_STRIP_SEPARATORS), region)
+
+
+def _fast_normalize_cleaned(cleaned: str, region: str) -> Optional[str]:
+    """``_fast_normalize`` for input that already had separators stripped."""
+    if cleaned.startswith("+"):
+        return _fast_e164(cleaned)
+    if region not in _NANP_REGIONS or not (cleaned.isascii() and cleaned.isdigit()):
+        return None
+    if len(cleaned) == 11 and cleaned[0] == "1":
+        cleaned = cleaned[1:]
+    if len(cleaned) == 10 and cleaned[0] not in "01":
+        return "+1" + cleaned
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse(number: str, region: str) -> PhoneNumber:
+    """phonenumbers.parse, memoized so helpers looking at the same input share one object."""
+    return phonenumbers.parse(number, region)
+
+
+def parse_number(number: str, default_region: str = "US") -> PhoneNumber:
+    """Parse a phone number once so it can be handed to several helpers.
+
+    Repeated inputs return the same PhoneNumber object, so treat it as read-only.
     Raises ValueError if the number cannot be parsed.
     """
     try:
-        pn = phonenumbers.parse(number, default_region)
-        if not phonenumbers.is_possible_number(pn) and not phonenumbers.is_valid_number(pn):
-            # still try to format; downstream code may ignore invalids
-            pass
-        return phonenumbers.format_number(pn, PhoneNumberFormat.E164)
+        return _parse(number, default_region)
     except NumberParseException as e:
-        raise ValueError(f"Could not parse phone number '{number}': {e}")
+        raise ValueError(f"Could not parse phone number '{number}': {e}") from e
+
 
+@lru_cache(maxsize=100_000)
+def _parse_cached(number: str, region: str) -> Tuple[bool, str]:
+    """Parse ``number`` into E.164, memoized per (number, region).
 
-def load_contacts_csv(path: str, phone_column: str = "phone", name_column: str = "name", default_region: str = "US") -> Dict[str, str]:
+    Returns (True, e164) or (False, error message). Failures are returned rather
+    than raised so lru_cache remembers them too and bad input is only parsed once.
+    """
+    try:
+        pn = _parse(number, region)
+        # invalid numbers are still formatted; downstream code may ignore them
+        return True, phonenumbers.format_number(pn, PhoneNumberFormat.E164)
+    except NumberParseException as e:
+        return False, f"Could not parse phone number '{number}': {e}"
+
+
+def normalize_number(number: str, default_region: str = "US") -> str:
+    """Parse and return an E.164 formatted phone number.
+
+    Input that is E.164 (or, for NANP regions, a 10-digit national number)
+    apart from spacing/punctuation is returned without parsing; other results
+    (including failures) are cached, so repeated numbers are only parsed once.
+    Raises ValueError if the number cannot be parsed.
+    """
+    fast = _fast_normalize(number, default_region)
+    if fast:
+        return fast
+    ok, result = _parse_cached(number, default_region)
+    if not ok:
+        raise ValueError(result)
+    return result
+
+
+def _normalize_chunk(rows: List[Tuple[str, str]], region: str, names: Optional[Dict[str, str]] = None) -> List[Tuple[str, str]]:
+    """Normalize a chunk of (raw_phone, name) rows, dropping unparseable numbers.
+
+    Repeated names are returned as one shared str object. Pass the same ``names``
+    dict for every chunk to share them across the whole file; by default sharing
+    is per chunk. Module-level so it can be shipped to worker processes.
+    """
+    pairs: List[Tuple[str, str]] = []
+    # rows already seen in this chunk; cheaper than going through the lru_cache
+    seen: Dict[str, Optional[str]] = {}
+    # one str object per distinct name, so repeated names (families, companies)
+    # share memory in the resulting mapping
+    if names is None:
+        names = {}
+    # Strip separators from the whole phone column in one translate call rather
+    # than one per row. A quoted field can contain a newline, in which case the
+    # split doesn't line up and we fall back to cleaning row by row.
+    raw_phones = [raw_phone for raw_phone, _ in rows]
+    cleaned_phones = "\n".join(raw_phones).translate(_STRIP_SEPARATORS).split("\n")
+    if len(cleaned_phones) != len(rows):
+        cleaned_phones = [raw_phone.translate(_STRIP_SEPARATORS) for raw_phone in raw_phones]
+    for (raw_phone, name), cleaned in zip(rows, cleaned_phones):
+        if raw_phone in seen:
+            normalized = seen[raw_phone]
+        else:
+            normalized = _fast_normalize_cleaned(cleaned, region)
+            if normalized is None and sum(map(str.isdecimal, cleaned)) >= _MIN_PARSEABLE_DIGITS:
+                ok, result = _parse_cached(raw_phone, region)
+                if ok:
+                    normalized = result
+            seen[raw_phone] = normalized
+        if normalized is None:
+            # skip unparseable numbers
+            continue
+        pairs.append((normalized, names.setdefault(name, name)))
+    return pairs
+
+
+def _warm_worker(region: str) -> None:
+    """Load the region's phonenumbers metadata before a worker gets its first chunk."""
+    phonenumbers.PhoneMetadata.metadata_for_region(region)
+
+
+def _iter_chunks(rows: Iterable[Tuple[str, str]], size: int) -> Iterator[List[Tuple[str, str]]]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class CompactContacts(Mapping[str, str]):
+    """Read-only normalized phone -> name mapping for very large contact lists.
+
+    E.164 numbers are stored as integers in a sorted array and found by binary
+    search, which takes a fraction of the memory of a dict keyed by strings.
+    The rare number too long for a 64-bit slot (phonenumbers accepts up to 20
+    digits) is kept in a small side dict instead.
+    """
+
+    def __init__(self, contacts: Mapping[str, str]):
+        items = []
+        self._overflow: Dict[str, str] = {}
+        for number, name in contacts.items():
+            key = int(number[1:])
+            if key > _MAX_PACKED_NUMBER:
+                self._overflow[number] = name
+            else:
+                items.append((key, name))
+        items.sort()
+        self._numbers = array("Q", [number for number, _ in items])
+        self._names = [name for _, name in items]
+
+    def _index(self, number: str) -> int:
+        digits = number[1:] if isinstance(number, str) and number.startswith("+") else ""
+        if not digits.isdecimal():
+            return -1
+        key = int(digits)
+        i = bisect_left(self._numbers, key)
+        if i < len(self._numbers) and self._numbers[i] == key:
+            return i
+        return -1
+
+    def __getitem__(self, number: str) -> str:
+        i = self._index(number)
+        if i < 0:
+            return self._overflow[number]
+        return self._names[i]
+
+    def __contains__(self, number: object) -> bool:
+        return self._index(number) >= 0 or number in self._overflow
+
+    def __iter__(self) -> Iterator[str]:
+        return chain((f"+{number}" for number in self._numbers), self._overflow)
+
+    def __len__(self) -> int:
+        return len(self._numbers) + len(self._overflow)
+
+
+def _iter_rows(path: str, phone_column: str, name_column: str) -> Iterator[Tuple[str, str]]:
+    """Yield stripped (raw_phone, name) pairs from a contacts CSV, skipping rows without a phone."""
+    # read in large blocks; rows are still consumed lazily so memory stays flat.
+    # Stray non-UTF-8 bytes (e.g. latin-1 names) become U+FFFD instead of aborting the load.
+    with io.TextIOWrapper(open(path, "rb", buffering=_CSV_BUFFER_SIZE), encoding="utf-8", errors="replace", newline="") as f:
+        yield from _iter_reader_rows(csv.reader(f), phone_column, name_column)
+
+
+def _iter_reader_rows(reader: Iterator[List[str]], phone_column: str, name_column: str) -> Iterator[Tuple[str, str]]:
+    header = next(reader, None)
+    if not header or phone_column not in header or name_column not in header:
+        return
+    # resolve column positions once instead of building a dict per row
+    phone_idx = header.index(phone_column)
+    name_idx = header.index(name_column)
+    max_idx = max(phone_idx, name_idx)
+    for row in reader:
+        if len(row) <= max_idx:
+            continue
+        raw_phone = row[phone_idx].strip()
+        if raw_phone:
+            yield raw_phone, row[name_idx].strip()
+
+
+class _MmapReader(io.RawIOBase):
+    """Raw read-only stream over an mmap, so it can sit under io.BufferedReader."""
+
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._mm.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _iter_rows_mmap(path: str, phone_column: str, name_column: str) -> Iterator[Tuple[str, str]]:
+    """``_iter_rows`` reading the file through a read-only memory map.
+
+    Pages are faulted in by the OS as the file is consumed. Decoding and newline
+    handling use the same TextIOWrapper settings as the default engine, so line
+    endings and quoting behave exactly as they do there.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses to map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            raw = io.BufferedReader(_MmapReader(mm), buffer_size=_CSV_BUFFER_SIZE)
+            with io.TextIOWrapper(raw, encoding="utf-8", errors="replace", newline="") as text:
+                yield from _iter_reader_rows(csv.reader(text), phone_column, name_column)
+
+
+def _iter_rows_pyarrow(path: str, phone_column: str, name_column: str) -> Iterator[Tuple[str, str]]:
+    """``_iter_rows`` backed by pyarrow's multithreaded CSV reader.
+
+    pyarrow is an optional dependency and is only imported when this engine is used.
+    Unlike the csv engine, rows whose field count differs from the header's are
+    dropped, even when the phone and name fields are present.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
+    except ImportError as e:
+        raise ImportError("engine='pyarrow' requires pyarrow; install it with 'pip install pyarrow'") from e
+
+    # check the header ourselves so a missing column behaves like the csv engine
+    with open(path, newline="", encoding="utf-8", errors="replace") as f:
+        header = next(csv.reader(f), None)
+    if not header or phone_column not in header or name_column not in header:
+        return
+
+    table = pac.read_csv(
+        path,
+        read_options=pac.ReadOptions(use_threads=True, block_size=_CSV_BUFFER_SIZE),
+        # quoted names may span lines, as the csv module allows; rows with the wrong
+        # number of fields are skipped rather than failing the whole read
+        parse_options=pac.ParseOptions(newlines_in_values=True, invalid_row_handler=lambda row: "skip"),
+        convert_options=pac.ConvertOptions(
+            include_columns=[phone_column, name_column],
+            # read as bytes so invalid UTF-8 is replaced like in the csv engine, not an error
+            column_types={phone_column: pa.binary(), name_column: pa.binary()},
+        ),
+    )
+    phones = table.column(phone_column).to_pylist()
+    names = table.column(name_column).to_pylist()
+    for raw_phone, name in zip(phones, names):
+        raw_phone = (raw_phone or b"").decode("utf-8", "replace").strip()
+        if raw_phone:
+            yield raw_phone, (name or b"").decode("utf-8", "replace").strip()
+
+
+_ROW_READERS: Dict[str, Callable[[str, str, str], Iterator[Tuple[str, str]]]] = {
+    "csv": _iter_rows,
+    "mmap": _iter_rows_mmap,
+    "pyarrow": _iter_rows_pyarrow,
+}
+
+
+def load_contacts_csv(path: str, phone_column: str = "phone", name_column: str = "name", default_region: str = "US", jobs: Optional[int] = 1, engine: str = "csv") -> Mapping[str, str]:
     """Load contacts from a CSV file and return a mapping of normalized phone -> name.
 
     CSV must contain headers. Rows with unparseable numbers are skipped.
+    Very large contact lists are returned as a CompactContacts to save memory.
+    ``jobs`` > 1 normalizes row chunks in that many worker processes; ``None``
+    uses one worker per CPU. ``engine="mmap"`` reads the file through a memory
+    map. ``engine="pyarrow"`` parses the file with pyarrow's threaded CSV
+    reader, which is much faster on multi-GB files but reads the two columns
+    fully into memory; it needs pyarrow to be installed.
     """
-    contacts: Dict[str, str] = {}
-    if not os.path.exists(path):
-        raise FileNotFoundError(path)
-
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if phone_column not in row or name_column not in row:
-                continue
-            raw_phone = row[phone_column].strip()
-            name = row[name_column].strip()
-            if not raw_phone:
-                continue
-            try:
-                normalized = normalize_number(raw_phone, default_region)
-                contacts[normalized] = name
-            except ValueError:
-                # skip unparseable numbers
-                continue
+    if engine not in _ROW_READERS:
+        raise ValueError(f"Unknown CSV engine {engine!r}; expected one of {', '.join(_ROW_READERS)}")
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    chunks = _iter_chunks(_ROW_READERS[engine](path, phone_column, name_column), _CHUNK_ROWS)
+    # build the dict in one pass from the normalized pairs; later rows win
+    if jobs > 1:
+        # multiprocessing is only imported when a pool is actually used
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker, initargs=(default_region,)) as pool:
+            contacts = dict(chain.from_iterable(pool.map(_normalize_chunk, chunks, repeat(default_region))))
+    else:
+        # one name cache for the whole file; worker processes can only share per chunk
+        names: Dict[str, str] = {}
+        contacts = dict(chain.from_iterable(_normalize_chunk(chunk, default_region, names) for chunk in chunks))
+    if len(contacts) > _COMPACT_THRESHOLD:
+        return CompactContacts(contacts)
     return contacts
 
 
-def find_name_local(number: str, contacts: Dict[str, str], default_region: str = "US") -> Optional[str]:
+def iter_contacts_csv(path: str, batch_size: int = 10_000, phone_column: str = "phone", name_column: str = "name", default_region: str = "US") -> Iterator[Dict[str, str]]:
+    """Yield the contacts in a CSV file as normalized phone -> name dicts of up to ``batch_size`` rows.
+
+    Only one batch is held in memory at a time.
+    """
+    for chunk in _iter_chunks(_iter_rows(path, phone_column, name_column), batch_size):
+        yield dict(_normalize_chunk(chunk, default_region))
+
+
+def find_name_streaming(number: Union[str, PhoneNumber], path: str, default_region: str = "US", batch_size: int = 10_000, phone_column: str = "phone", name_column: str = "name") -> Optional[str]:
+    """Look up a single number in a contacts CSV without loading the whole file.
+
+    As with ``load_contacts_csv`` the last row for the number wins, so every row
+    is read and normalized: this saves memory, not time. Only one batch is held
+    at a time, so memory use is bounded by ``batch_size`` rather than the file size.
+    Returns the name if found, otherwise None.
+    """
+    try:
+        if isinstance(number, PhoneNumber):
+            target = phonenumbers.format_number(number, PhoneNumberFormat.E164)
+        else:
+            target = normalize_number(number, default_region)
+    except ValueError:
+        return None
+    found = None
+    for batch in iter_contacts_csv(path, batch_size, phone_column, name_column, default_region):
+        name = batch.get(target)
+        if name is not None:
+            found = name
+    return found
+
+
+def find_name_local(number: Union[str, PhoneNumber], contacts: Mapping[str, str], default_region: str = "US") -> Optional[str]:
     """Find a name in the provided contacts mapping for the given phone number.
 
+    ``number`` may be a raw string or an already parsed PhoneNumber.
     Returns the name if found, otherwise None.
     """
+    if isinstance(number, PhoneNumber):
+        return contacts.get(phonenumbers.format_number(number, PhoneNumberFormat.E164))
+    # keys are already normalized, so an exact match needs no parsing at all
+    name = contacts.get(number)
+    if name is not None:
+        return name
     try:
         normalized = normalize_number(number, default_region)
     except ValueError:
@@ -64,19 +495,261 @@ def find_name_local(number: str, contacts: Dict[str, str], default_region: str =
     return contacts.get(normalized)
 
 
+class _RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` calls per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+_limiters: Dict[str, _RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _limiter_for(host: str) -> _RateLimiter:
+    """Return the process-wide rate limiter shared by all requests to ``host``."""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = _RateLimiter(_RATE_LIMITS.get(host, _DEFAULT_RATE_LIMIT))
+        return limiter
+
+
+def _start_daemon_task(fn: Callable, *args) -> Future:
+    """Run ``fn(*args)`` on a daemon thread and return a Future for its result.
+
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined at interpreter
+    exit. Used by ExternalLookup.lookup_all_in_background.
+    """
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _retry_delay(resp: "requests.Response", attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying ``resp``, or None if it shouldn't be retried yet."""
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is None:
+        return _RETRY_BACKOFF * 2 ** attempt
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        # an HTTP-date; don't guess, just give up on this attempt
+        return None
+    if seconds > _MAX_RETRY_AFTER:
+        return None
+    return max(seconds, 0.0)
+
+
+def _new_session() -> "requests.Session":
+    """Build a pooled requests session that retries a failed connect once.
+
+    requests is imported here rather than at module level so lookups that never
+    reach an external provider don't pay for importing it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Lookups sit on the synchronous web request path, so keep the worst case close to
+    # one timeout: retry a failed connect once and never re-send after a read timeout.
+    # A failed connect never reached the provider, so it needn't go through the rate
+    # limiter; status retries do, and are handled in ExternalLookup._get.
+    retry = Retry(total=1, connect=1, read=0, backoff_factor=_RETRY_BACKOFF)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _orjson_loads() -> Optional[Callable[[bytes], object]]:
+    """Return orjson.loads if orjson is installed, importing it on first use."""
+    try:
+        import orjson
+    except ImportError:  # optional: faster JSON decoding for provider responses
+        return None
+    return orjson.loads
+
+
+def _decode_json(resp: "requests.Response"):
+    """Decode a JSON response body, using orjson when it is installed."""
+    loads = _orjson_loads()
+    if loads is not None:
+        return loads(resp.content)
+    return resp.json()
+
+
+def _cached(provider: str) -> Callable:
+    """Serve ``lookup_<provider>`` from the instance's caches when possible.
+
+    Answered lookups (including "no match") are kept in a short-lived in-memory
+    cache and, when one is configured, the persistent ResponseCache. Failed
+    requests are never cached.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
+            try:
+                normalized = normalize_number(number, default_region)
+            except ValueError:
+                return False, None
+            key = (provider, normalized)
+            hit = self._memo.get(key)
+            if hit is None and self.cache is not None:
+                hit = self.cache.get(provider, normalized)
+                if hit is not None:
+                    self._memo.set(key, hit)
+            if hit is not None:
+                return hit
+            ok, value = method(self, normalized, default_region)
+            if ok:
+                self._memo.set(key, (ok, value))
+                if self.cache is not None:
+                    self.cache.set(provider, normalized, value)
+            return ok, value
+
+        return wrapper
+
+    return decorator
+
+
 class ExternalLookup:
     """A small adapter for optional external lookups (hooks).
 
     Currently supports:
     - NumVerify (validation/carrier hints)
     - Twilio Lookup (caller-name when available; requires Twilio credentials and may be a paid lookup)
+    - Yelp, Google Places and OpenCorporates (business / company names)
+
+    Answers are remembered in memory for a few minutes; pass a ResponseCache as
+    ``cache`` to also reuse them across processes.
     """
 
-    def __init__(self, numverify_key: Optional[str] = None, twilio_sid: Optional[str] = None, twilio_token: Optional[str] = None):
+    def __init__(self, numverify_key: Optional[str] = None, twilio_sid: Optional[str] = None, twilio_token: Optional[str] = None, cache: Optional[ResponseCache] = None):
         self.numverify_key = numverify_key
         self.twilio_sid = twilio_sid
         self.twilio_token = twilio_token
+        self.cache = cache
+        # recent answers, so repeat lookups within a few minutes skip the network
+        self._memo = TTLCache(maxsize=10_000, ttl=300)
+        # one pooled session per instance so repeat lookups reuse keep-alive connections;
+        # created on first request
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        # bounded worker pool shared by every lookup_all call on this instance
+        self._executor = ThreadPoolExecutor(max_workers=_LOOKUP_WORKERS, thread_name_prefix="phone-finder-lookup")
+
+    def lookup_all(self, number: str, default_region: str = "US", providers: Optional[Iterable[str]] = None) -> Tuple[Optional[str], bool, Optional[str]]:
+        """Query several providers concurrently and return the best answer.
+
+        ``providers`` is a subset of PROVIDER_PRIORITY (default: all of them). Lookups run
+        in parallel on the instance's thread pool, so the wait is the slowest provider
+        rather than the sum of all of them. The result of the highest-priority provider
+        that returned a value wins; lookups that haven't started by then are cancelled.
+
+        Returns (provider, success, result) where provider is None if nothing matched and
+        success tells whether any provider answered at all.
+        """
+        return self._lookup_all(number, default_region, providers, self._executor.submit)
+
+    def lookup_all_in_background(self, number: str, default_region: str = "US", providers: Optional[Iterable[str]] = None) -> Future:
+        """Start ``lookup_all`` on daemon threads and return a Future for its result.
+
+        Daemon threads are not joined at interpreter exit, so a caller that may stop
+        needing the answer (such as the CLI, when the number turns up in local
+        contacts) can exit at once instead of waiting on slow providers.
+        """
+        return _start_daemon_task(self._lookup_all, number, default_region, providers, _start_daemon_task)
+
+    def _lookup_all(self, number: str, default_region: str, providers: Optional[Iterable[str]], submit: Callable[..., Future]) -> Tuple[Optional[str], bool, Optional[str]]:
+        wanted = set(PROVIDER_PRIORITY if providers is None else providers)
+        names = [name for name in PROVIDER_PRIORITY if name in wanted]
+        if not names:
+            return None, False, None
+        # normalize once; providers then see E.164 input, which skips the parser
+        try:
+            number = normalize_number(number, default_region)
+        except ValueError:
+            return None, False, None
 
+        futures = {name: submit(getattr(self, f"lookup_{name}"), number, default_region) for name in names}
+        try:
+            pending = set(futures.values())
+            while pending:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # walk in priority order; stop at the first provider still in flight
+                for name in names:
+                    fut = futures[name]
+                    if not fut.done():
+                        break
+                    ok, value = fut.result()
+                    if ok and value:
+                        return name, True, value
+            return None, any(fut.result()[0] for fut in futures.values()), None
+        finally:
+            # don't send requests whose answer can no longer matter
+            for fut in futures.values():
+                fut.cancel()
+
+    def _get(self, url: str, **kwargs) -> "requests.Response":
+        """GET ``url`` on the pooled session, waiting on the host's rate limiter before each attempt.
+
+        Throttled or failing responses are retried up to ``_STATUS_RETRIES`` times;
+        the last response is returned either way.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = _new_session()
+        limiter = _limiter_for(urlsplit(url).hostname or "")
+        kwargs.setdefault("timeout", 8)
+        attempt = 0
+        while True:
+            limiter.acquire()
+            resp = self._session.get(url, **kwargs)
+            if resp.status_code not in _RETRY_STATUSES or attempt == _STATUS_RETRIES:
+                return resp
+            delay = _retry_delay(resp, attempt)
+            if delay is None:
+                return resp
+            resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_json(self, url: str, **kwargs):
+        """GET ``url`` and return the decoded JSON body; raises on HTTP errors."""
+        resp = self._get(url, **kwargs)
+        resp.raise_for_status()
+        return _decode_json(resp)
+
+    @_cached("numverify")
     def lookup_numverify(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
         """Query NumVerify (if key provided).
 
@@ -92,9 +765,7 @@ class ExternalLookup:
         url = "http://apilayer.net/api/validate"
         params = {"access_key": self.numverify_key, "number": normalized}
         try:
-            resp = requests.get(url, params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_json(url, params=params)
             hints = []
             if data.get("carrier"):
                 hints.append(f"carrier={data['carrier']}")
@@ -107,6 +778,7 @@ class ExternalLookup:
         except Exception:
             return False, None
 
+    @_cached("twilio")
     def lookup_twilio(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
         """Query Twilio Lookup API for caller-name (if credentials provided).
 
@@ -118,6 +790,24 @@ class ExternalLookup:
         if not sid or not token:
             return False, None
 
+        try:
+            normalized = normalize_number(number, default_region)
+        except ValueError:
+            return False, None
+
+        url = f"https://lookups.twilio.com/v1/PhoneNumbers/{normalized}"
+        params = {"Type": "caller-name"}
+        try:
+            data = self._get_json(url, auth=(sid, token), params=params)
+            caller = data.get("caller_name") or {}
+            name = caller.get("caller_name")
+            if name:
+                return True, name
+            return True, None
+        except Exception:
+            return False, None
+
+    @_cached("yelp")
     def lookup_yelp(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
         """Query Yelp Fusion Phone Search for businesses matching the phone number.
 
@@ -137,9 +827,7 @@ class ExternalLookup:
         headers = {"Authorization": f"Bearer {api_key}"}
         params = {"phone": normalized}
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_json(url, headers=headers, params=params)
             businesses = data.get("businesses") or []
             if businesses:
                 top = businesses[0]
@@ -149,6 +837,7 @@ class ExternalLookup:
         except Exception:
             return False, None
 
+    @_cached("google")
     def lookup_google(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
         """Query Google Places 'Find Place' by phone number.
 
@@ -159,40 +848,6 @@ class ExternalLookup:
         if not api_key:
             return False, None
 
-    def lookup_opencorporates(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
-        """Query OpenCorporates companies search for the phone number.
-
-        OpenCorporates doesn't have a dedicated phone-search endpoint, but their
-        companies search can match text fields. This does a best-effort search for
-        the normalized number and returns the top company's name if any.
-
-        Requires OPENCORPORATES_API_KEY in env (optional; unauthenticated calls are rate-limited).
-        """
-        api_key = os.environ.get("OPENCORPORATES_API_KEY")
-        try:
-            normalized = normalize_number(number, default_region)
-        except ValueError:
-            return False, None
-
-        url = "https://api.opencorporates.com/v0.4/companies/search"
-        params = {"q": normalized}
-        if api_key:
-            params["api_token"] = api_key
-        try:
-            resp = requests.get(url, params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results", {}).get("companies") or []
-            if not results:
-                return True, None
-            # Extract company name from top result
-            top = results[0]
-            company = top.get("company") or {}
-            name = company.get("name")
-            return True, name
-        except Exception:
-            return False, None
-
         try:
             normalized = normalize_number(number, default_region)
         except ValueError:
@@ -206,9 +861,7 @@ class ExternalLookup:
             "key": api_key,
         }
         try:
-            resp = requests.get(url, params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_json(url, params=params)
             candidates = data.get("candidates") or []
             if candidates:
                 top = candidates[0]
@@ -218,45 +871,70 @@ class ExternalLookup:
         except Exception:
             return False, None
 
+    @_cached("opencorporates")
+    def lookup_opencorporates(self, number: str, default_region: str = "US") -> Tuple[bool, Optional[str]]:
+        """Query OpenCorporates companies search for the phone number.
+
+        OpenCorporates doesn't have a dedicated phone-search endpoint, but their
+        companies search can match text fields. This does a best-effort search for
+        the normalized number and returns the top company's name if any.
+
+        Requires OPENCORPORATES_API_KEY in env (optional; unauthenticated calls are rate-limited).
+        """
+        api_key = os.environ.get("OPENCORPORATES_API_KEY")
         try:
             normalized = normalize_number(number, default_region)
         except ValueError:
             return False, None
 
-        url = f"https://lookups.twilio.com/v1/PhoneNumbers/{normalized}"
-        params = {"Type": "caller-name"}
+        url = "https://api.opencorporates.com/v0.4/companies/search"
+        params = {"q": normalized}
+        if api_key:
+            params["api_token"] = api_key
         try:
-            resp = requests.get(url, auth=(sid, token), params=params, timeout=8)
-            resp.raise_for_status()
-            data = resp.json()
-            caller = data.get("caller_name") or {}
-            name = caller.get("caller_name")
-            if name:
-                return True, name
-            return True, None
+            data = self._get_json(url, params=params)
+            results = data.get("results", {}).get("companies") or []
+            if not results:
+                return True, None
+            # Extract company name from top result
+            top = results[0]
+            company = top.get("company") or {}
+            name = company.get("name")
+            return True, name
         except Exception:
             return False, None
 
 
-def get_number_info(number: str, default_region: str = "US") -> Dict[str, Optional[str]]:
+def get_number_info(number: Union[str, PhoneNumber], default_region: str = "US") -> Dict[str, Optional[str]]:
     """Return free metadata for a phone number using the phonenumbers library.
 
+    ``number`` may be a raw string or an already parsed PhoneNumber.
     Returns a dict with keys: normalized, is_valid, is_possible, region, description,
     carrier, line_type, timezones. If parsing fails the dict will contain an 'error' key.
     """
+    # the carrier/geocoder/timezone data tables are large; only load them when needed
+    from phonenumbers import carrier as _carrier
+    from phonenumbers import geocoder as _geocoder
+    from phonenumbers import timezone as _timezone
+
     info: Dict[str, Optional[str]] = {}
-    try:
-        pn = phonenumbers.parse(number, default_region)
-    except NumberParseException as e:
-        return {"error": str(e)}
+    if isinstance(number, PhoneNumber):
+        pn = number
+    else:
+        try:
+            pn = _parse(number, default_region)
+        except NumberParseException as e:
+            return {"error": str(e)}
 
     try:
         info["normalized"] = phonenumbers.format_number(pn, PhoneNumberFormat.E164)
     except Exception:
         info["normalized"] = None
 
-    info["is_possible"] = str(phonenumbers.is_possible_number(pn))
-    info["is_valid"] = str(phonenumbers.is_valid_number(pn))
+    possible = phonenumbers.is_possible_number(pn)
+    info["is_possible"] = str(possible)
+    # an impossible number is never valid, so skip the costlier validity check
+    info["is_valid"] = str(possible and phonenumbers.is_valid_number(pn))
 
     # region / description
     try:
@@ -275,22 +953,7 @@ def get_number_info(number: str, default_region: str = "US") -> Dict[str, Option
     # line type
     try:
         nt = phonenumbers.number_type(pn)
-        # Map numeric enum to readable name
-        type_map = {
-            phonenumbers.PhoneNumberType.FIXED_LINE: "FIXED_LINE",
-            phonenumbers.PhoneNumberType.MOBILE: "MOBILE",
-            phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "FIXED_LINE_OR_MOBILE",
-            phonenumbers.PhoneNumberType.TOLL_FREE: "TOLL_FREE",
-            phonenumbers.PhoneNumberType.PREMIUM_RATE: "PREMIUM_RATE",
-            phonenumbers.PhoneNumberType.SHARED_COST: "SHARED_COST",
-            phonenumbers.PhoneNumberType.VOIP: "VOIP",
-            phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "PERSONAL_NUMBER",
-            phonenumbers.PhoneNumberType.PAGER: "PAGER",
-            phonenumbers.PhoneNumberType.UAN: "UAN",
-            phonenumbers.PhoneNumberType.VOICEMAIL: "VOICEMAIL",
-            phonenumbers.PhoneNumberType.UNKNOWN: "UNKNOWN",
-        }
-        info["line_type"] = type_map.get(nt, str(nt))
+        info["line_type"] = _PHONE_TYPE_NAMES.get(nt, str(nt))
     except Exception:
         info["line_type"] = None
 
@@ -1,7 +1,42 @@
 from flask import Flask, render_template, request
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 import os
+import threading
 
-from .lookup import load_contacts_csv, find_name_local, ExternalLookup, get_number_info
+from .lookup import load_contacts_csv, find_name_local, ExternalLookup, get_number_info, PAID_PROVIDERS
+
+
+class LookupResult(NamedTuple):
+    """Outcome of a lookup as rendered by index.html."""
+
+    found: bool
+    name: Optional[str] = None
+    meta: Optional[Dict[str, Any]] = None
+
+
+# (path, region) -> (mtime_ns, size, contacts); one entry per file, replaced when the
+# file changes so outdated copies of a large contact list aren't kept alive.
+_contacts_cache: Dict[Tuple[str, str], Tuple[int, int, Mapping[str, str]]] = {}
+_contacts_cache_lock = threading.Lock()
+
+
+def _load_contacts(path: str, region: str) -> Mapping[str, str]:
+    """Return the contacts in ``path``, re-reading the file only when it changed.
+
+    The mapping is shared between requests, so it is read-only.
+    """
+    stat = os.stat(path)
+    key = (path, region)
+    with _contacts_cache_lock:
+        entry = _contacts_cache.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+        # drop the outdated copy before loading the new one
+        _contacts_cache.pop(key, None)
+        contacts = MappingProxyType(load_contacts_csv(path, default_region=region))
+        _contacts_cache[key] = (stat.st_mtime_ns, stat.st_size, contacts)
+        return contacts
 
 
 def create_app(test_config=None):
@@ -19,6 +54,27 @@ def create_app(test_config=None):
     if test_config:
         app.config.update(test_config)
 
+    # Prepare external lookup clients from environment once per app, so the
+    # client's pooled HTTP connections are reused across requests.
+    sid = os.environ.get("TWILIO_ACCOUNT_SID")
+    token = os.environ.get("TWILIO_AUTH_TOKEN")
+    numverify_key = os.environ.get("NUMVERIFY_API_KEY")
+    oc_key = os.environ.get("OPENCORPORATES_API_KEY")
+    yelp_key = os.environ.get("YELP_API_KEY")
+    ext = ExternalLookup(numverify_key=numverify_key, twilio_sid=sid, twilio_token=token)
+    providers = [
+        name
+        for name, configured in (
+            ("opencorporates", oc_key),
+            ("yelp", yelp_key),
+            ("twilio", sid and token),
+            ("numverify", numverify_key),
+        )
+        if configured
+    ]
+    free_providers = [name for name in providers if name not in PAID_PROVIDERS]
+    paid_providers = [name for name in providers if name in PAID_PROVIDERS]
+
     @app.route("/", methods=("GET", "POST"))
     def index():
         result = None
@@ -29,9 +85,12 @@ def create_app(test_config=None):
         if request.method == "POST":
             number = (request.form.get("number") or "").strip()
             contacts = {}
-            if app.config.get("CONTACTS_PATH"):
+            if not number:
+                # nothing to look up, so don't touch the contacts file or providers
+                error = "Enter a number"
+            elif app.config.get("CONTACTS_PATH"):
                 try:
-                    contacts = load_contacts_csv(app.config["CONTACTS_PATH"], default_region=app.config["DEFAULT_REGION"])
+                    contacts = _load_contacts(app.config["CONTACTS_PATH"], app.config["DEFAULT_REGION"])
                 except FileNotFoundError:
                     contacts = {}
                     error = f"Contacts file not found: {app.config['CONTACTS_PATH']}"
@@ -39,45 +98,25 @@ def create_app(test_config=None):
             if not error:
                 name = find_name_local(number, contacts, default_region=app.config["DEFAULT_REGION"])
                 if name:
-                    result = {"found": True, "name": name}
+                    result = LookupResult(found=True, name=name)
                 else:
-                    # Prepare external lookup clients from environment
-                    sid = os.environ.get("TWILIO_ACCOUNT_SID")
-                    token = os.environ.get("TWILIO_AUTH_TOKEN")
-                    numverify_key = os.environ.get("NUMVERIFY_API_KEY")
-                    ext = ExternalLookup(numverify_key=numverify_key, twilio_sid=sid, twilio_token=token)
-
-                    oc_key = os.environ.get("OPENCORPORATES_API_KEY")
-                    yelp_key = os.environ.get("YELP_API_KEY")
-
-                    # Try providers in priority order until we find a name
-                    # 1) OpenCorporates (company)
-                    if oc_key:
-                        ok, remote_name = ext.lookup_opencorporates(number, default_region=app.config["DEFAULT_REGION"])
-                        if ok and remote_name:
-                            result = {"found": True, "name": remote_name}
-
-                    # 2) Yelp Fusion (business)
-                    if not result and yelp_key:
-                        ok, remote_name = ext.lookup_yelp(number, default_region=app.config["DEFAULT_REGION"])
-                        if ok and remote_name:
-                            result = {"found": True, "name": remote_name}
-
-                    # 4) Twilio CNAM (if credentials present)
-                    if not result and sid and token:
-                        ok, remote_name = ext.lookup_twilio(number, default_region=app.config["DEFAULT_REGION"])
-                        if ok and remote_name:
-                            result = {"found": True, "name": remote_name}
-
-                    # 5) NumVerify (best-effort hints)
-                    if not result and numverify_key:
-                        ok, hint = ext.lookup_numverify(number, default_region=app.config["DEFAULT_REGION"])
+                    # The highest-priority name wins: OpenCorporates (company), Yelp
+                    # (business), Twilio CNAM. NumVerify ranks last and only contributes a
+                    # hint, never a name. The free providers are queried concurrently first;
+                    # the paid ones rank below them and are only billed if those found nothing.
+                    region = app.config["DEFAULT_REGION"]
+                    provider, _, value = ext.lookup_all(number, default_region=region, providers=free_providers)
+                    if not provider:
+                        provider, _, value = ext.lookup_all(number, default_region=region, providers=paid_providers)
+                    if provider == "numverify":
+                        hint = value
+                    elif provider:
+                        result = LookupResult(found=True, name=value)
 
                     # If still no exact name, return metadata
                     if not result:
-                        result = {"found": False}
                         meta = get_number_info(number, default_region=app.config["DEFAULT_REGION"])
-                        result["meta"] = meta
+                        result = LookupResult(found=False, meta=meta)
 
         return render_template("index.html", result=result, hint=hint, error=error, number=number)
 
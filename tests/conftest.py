@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+
+class FakeResponse:
+    """Stand-in for a requests.Response from a provider."""
+
+    def __init__(self, data=None, status_code=200, headers=None):
+        self.data = data
+        self.content = json.dumps(data).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_response():
+    """The FakeResponse class, for tests that stub out provider requests."""
+    return FakeResponse
@@ -0,0 +1,132 @@
+import os
+import subprocess
+import sys
+import time
+
+from phone_finder import cli
+from phone_finder.cache import ResponseCache
+from phone_finder.lookup import ExternalLookup
+
+SAMPLE_CONTACTS = os.path.join(os.path.dirname(__file__), "..", "sample_contacts.csv")
+PROVIDER_ENV = ("YELP_API_KEY", "TWILIO_ACCOUNT_SID", "TWILIO_AUTH_TOKEN", "NUMVERIFY_API_KEY", "OPENCORPORATES_API_KEY")
+
+
+def _stub_providers(monkeypatch, fake_response, responses):
+    """Serve provider requests from ``responses`` (host -> JSON body) and record the hosts hit."""
+    calls = []
+    for var in PROVIDER_ENV:
+        monkeypatch.delenv(var, raising=False)
+
+    def fake_get(self, url, **kwargs):
+        host = url.split("/")[2]
+        calls.append(host)
+        return fake_response(responses[host])
+
+    monkeypatch.setattr(ExternalLookup, "_get", fake_get)
+    return calls
+
+
+def test_main_rejects_unparseable_number(capsys):
+    assert cli.main(["--number", "not a number"]) == 2
+    assert capsys.readouterr().out == "Could not parse number: (1) The string supplied did not seem to be a phone number.\n"
+
+
+def test_main_skips_providers_without_credentials(monkeypatch, capsys, fake_response):
+    calls = _stub_providers(monkeypatch, fake_response, {"api.yelp.com": {"businesses": [{"name": "Test Cafe"}]}})
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+
+    def no_cache(*args, **kwargs):
+        raise AssertionError("--no-cache must not open the response cache")
+
+    monkeypatch.setattr(cli, "ResponseCache", no_cache)
+    assert cli.main(["--number", "+1 415 555 2671", "--use-yelp", "--use-twilio", "--no-cache"]) == 0
+    assert capsys.readouterr().out == "Found business via Yelp: Test Cafe\n"
+    # Twilio was requested but has no credentials, so it is never called
+    assert calls == ["api.yelp.com"]
+
+
+def test_main_reuses_cached_provider_answers(tmp_path, monkeypatch, capsys, fake_response):
+    calls = _stub_providers(monkeypatch, fake_response, {"api.yelp.com": {"businesses": [{"name": "Test Cafe"}]}})
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    monkeypatch.setattr(cli, "ResponseCache", lambda: ResponseCache(str(tmp_path / "lookups.sqlite")))
+
+    for _ in range(2):
+        assert cli.main(["--number", "+1 415 555 2671", "--use-yelp"]) == 0
+    assert capsys.readouterr().out == "Found business via Yelp: Test Cafe\n" * 2
+    assert calls == ["api.yelp.com"]
+
+
+def test_main_reports_empty_external_answer(monkeypatch, capsys, fake_response):
+    _stub_providers(monkeypatch, fake_response, {"api.yelp.com": {"businesses": []}})
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    assert cli.main(["--number", "+1 415 555 2671", "--use-yelp", "--no-cache"]) == 1
+    assert "returned no identifying information" in capsys.readouterr().out
+
+
+def test_main_local_lookup_with_all_cpus(capsys):
+    assert cli.main(["--number", "+44 20 7946 0958", "--contacts", SAMPLE_CONTACTS, "--jobs", "0"]) == 0
+    assert capsys.readouterr().out == "Found locally: Charlie\n"
+
+
+def test_main_prints_number_info_without_providers(capsys):
+    assert cli.main(["--number", "+1 650 253 0000", "--contacts", SAMPLE_CONTACTS]) == 1
+    out = capsys.readouterr().out
+    assert out.startswith("No match found in local contacts.\nNumber info:\n")
+    assert "  normalized: +16502530000\n" in out
+
+
+def test_main_local_hit_skips_paid_providers(monkeypatch, capsys, fake_response):
+    calls = _stub_providers(monkeypatch, fake_response, {"api.yelp.com": {"businesses": []}})
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "sid")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "token")
+    argv = ["--number", "+1 415 555 2671", "--contacts", SAMPLE_CONTACTS, "--use-yelp", "--use-twilio", "--no-cache"]
+    assert cli.main(argv) == 0
+    assert capsys.readouterr().out == "Found locally: Alice\n"
+    assert "lookups.twilio.com" not in calls
+
+
+def test_main_local_miss_falls_back_to_providers_in_priority_order(monkeypatch, capsys, fake_response):
+    calls = _stub_providers(
+        monkeypatch,
+        fake_response,
+        {"api.yelp.com": {"businesses": []}, "lookups.twilio.com": {"caller_name": {"caller_name": "Jane Doe"}}},
+    )
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "sid")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "token")
+    argv = ["--number", "+1 650 253 0000", "--contacts", SAMPLE_CONTACTS, "--use-yelp", "--use-twilio", "--no-cache"]
+    assert cli.main(argv) == 0
+    assert capsys.readouterr().out == "Found via Twilio: Jane Doe\n"
+    assert sorted(calls) == ["api.yelp.com", "lookups.twilio.com"]
+
+
+def test_main_missing_contacts_file(tmp_path, monkeypatch, capsys, fake_response):
+    calls = _stub_providers(monkeypatch, fake_response, {"api.yelp.com": {"businesses": []}})
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "sid")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "token")
+    missing = str(tmp_path / "missing.csv")
+    assert cli.main(["--number", "+1 415 555 2671", "--contacts", missing, "--use-twilio", "--no-cache"]) == 2
+    assert capsys.readouterr().out == f"Contacts file not found: {missing}\n"
+    assert calls == []
+
+
+def test_main_local_hit_does_not_wait_for_slow_provider():
+    # a provider stuck on the network must not keep the process alive after a local hit
+    script = (
+        "import sys, threading, time\n"
+        "from phone_finder import cli\n"
+        "from phone_finder.lookup import ExternalLookup\n"
+        "started = threading.Event()\n"
+        "ExternalLookup._get = lambda self, url, **kwargs: started.set() or time.sleep(10)\n"
+        # only answer locally once the provider request is in flight
+        "find = cli.find_name_streaming\n"
+        "cli.find_name_streaming = lambda *args, **kwargs: started.wait(5) and find(*args, **kwargs)\n"
+        f"sys.exit(cli.main(['--number', '+1 415 555 2671', '--contacts', {SAMPLE_CONTACTS!r}, '--use-opencorporates', '--no-cache']))\n"
+    )
+    root = os.path.join(os.path.dirname(__file__), "..")
+    start = time.monotonic()
+    proc = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True, timeout=30)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout == "Found locally: Alice\n"
+    assert time.monotonic() - start < 5
@@ -1,6 +1,28 @@
 import os
+import sys
 import tempfile
-from phone_finder.lookup import load_contacts_csv, find_name_local
+import threading
+import time
+
+import pytest
+
+from phone_finder import lookup
+from phone_finder.cache import ResponseCache
+from phone_finder.lookup import (
+    CompactContacts,
+    ExternalLookup,
+    _fast_e164,
+    _fast_normalize,
+    _new_session,
+    _normalize_chunk,
+    _parse_cached,
+    _RateLimiter,
+    find_name_local,
+    find_name_streaming,
+    iter_contacts_csv,
+    load_contacts_csv,
+    normalize_number,
+)
 
 
 def test_local_lookup():
@@ -20,3 +42,326 @@ def test_local_lookup():
             os.unlink(path)
         except Exception:
             pass
+
+
+def test_find_name_local_exact_key_and_nanp_shapes():
+    contacts = {'+14155552671': 'Test Person'}
+    before = _parse_cached.cache_info()
+    assert find_name_local('+14155552671', contacts) == 'Test Person'
+    assert find_name_local('(415) 555-2671', contacts) == 'Test Person'
+    after = _parse_cached.cache_info()
+    # neither query needs the phonenumbers parser
+    assert (after.hits, after.misses) == (before.hits, before.misses)
+
+
+def test_load_contacts_parallel_matches_serial(monkeypatch):
+    rows = ["name,phone"] + [f"Person {i},+1 415 555 {i:04d}" for i in range(200)] + ["Nobody,not a number"]
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8') as tf:
+        tf.write("\n".join(rows) + "\n")
+        path = tf.name
+
+    try:
+        monkeypatch.setattr(lookup, "_CHUNK_ROWS", 64)
+        serial = load_contacts_csv(path, default_region='US')
+        parallel = load_contacts_csv(path, default_region='US', jobs=2)
+        assert len(serial) == 200
+        assert parallel == serial
+    finally:
+        try:
+            os.unlink(path)
+        except Exception:
+            pass
+
+
+def test_lookup_all_prefers_highest_priority_hit():
+    class FakeLookup(ExternalLookup):
+        def lookup_opencorporates(self, number, default_region="US"):
+            time.sleep(0.05)
+            return True, None
+
+        def lookup_yelp(self, number, default_region="US"):
+            time.sleep(0.1)
+            return True, "Yelp Business"
+
+        def lookup_twilio(self, number, default_region="US"):
+            return True, "Caller Name"
+
+        def lookup_numverify(self, number, default_region="US"):
+            return False, None
+
+    ext = FakeLookup()
+    providers = ["numverify", "twilio", "yelp", "opencorporates"]
+    assert ext.lookup_all('+1 415 555 2671', providers=providers) == ("yelp", True, "Yelp Business")
+    assert ext.lookup_all('+1 415 555 2671', providers=["numverify"]) == (None, False, None)
+    assert ext.lookup_all('+1 415 555 2671', providers=[]) == (None, False, None)
+
+
+def test_lookup_all_reuses_a_bounded_thread_pool():
+    class FakeLookup(ExternalLookup):
+        def lookup_yelp(self, number, default_region="US"):
+            return True, "Yelp Business"
+
+        def lookup_twilio(self, number, default_region="US"):
+            return True, None
+
+    ext = FakeLookup()
+    before = threading.active_count()
+    for _ in range(50):
+        assert ext.lookup_all('+1 415 555 2671', providers=["yelp", "twilio"])[0] == "yelp"
+    assert threading.active_count() - before <= lookup._LOOKUP_WORKERS
+
+
+def test_lookup_all_in_background_returns_future():
+    class FakeLookup(ExternalLookup):
+        def lookup_yelp(self, number, default_region="US"):
+            return True, "Yelp Business"
+
+    future = FakeLookup().lookup_all_in_background('+1 415 555 2671', providers=["yelp"])
+    assert future.result(timeout=5) == ("yelp", True, "Yelp Business")
+
+
+def test_rate_limiter_spaces_out_calls():
+    limiter = _RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(30):
+        limiter.acquire()
+    # the first 20 calls use the initial burst, the other 10 wait for refills
+    assert time.monotonic() - start >= 0.45
+
+
+def test_external_lookup_uses_response_cache(tmp_path, monkeypatch, fake_response):
+    calls = []
+
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    ext = ExternalLookup(cache=ResponseCache(str(tmp_path / "lookups.sqlite")))
+    monkeypatch.setattr(ext, "_get", lambda url, **kwargs: calls.append(url) or fake_response({"businesses": [{"name": "Cached Cafe"}]}))
+
+    assert ext.lookup_yelp('+1 415 555 2671') == (True, "Cached Cafe")
+    assert ext.lookup_yelp('(415) 555-2671') == (True, "Cached Cafe")
+    assert len(calls) == 1
+
+
+def test_external_lookup_survives_cache_errors(tmp_path, monkeypatch, fake_response):
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    cache = ResponseCache(str(tmp_path / "lookups.sqlite"))
+    # any sqlite3.Error from the cache (locked, closed, corrupt) must read as a miss
+    cache.close()
+    ext = ExternalLookup(cache=cache)
+    monkeypatch.setattr(ext, "_get", lambda url, **kwargs: fake_response({"businesses": [{"name": "Uncached Cafe"}]}))
+
+    assert ext.lookup_all('+1 415 555 2671', providers=["yelp"]) == ("yelp", True, "Uncached Cafe")
+
+
+def test_compact_contacts_behaves_like_dict():
+    contacts = {'+14155552671': 'Alice', '+442079460958': 'Charlie', '+255782292070': 'Mum'}
+    compact = CompactContacts(contacts)
+    assert len(compact) == 3
+    assert dict(compact) == contacts
+    assert find_name_local('+44 20 7946 0958', compact, default_region='US') == 'Charlie'
+    assert find_name_local('+1 202 555 0136', compact, default_region='US') is None
+    assert 'not a number' not in compact
+
+
+def test_compact_contacts_keeps_numbers_longer_than_64_bits():
+    long_number = normalize_number('+886 99999999999999999')
+    assert long_number == '+88699999999999999999'
+    contacts = {'+14155552671': 'Alice', long_number: 'Long'}
+    compact = CompactContacts(contacts)
+    assert len(compact) == 2
+    assert dict(compact) == contacts
+    assert compact[long_number] == 'Long'
+    assert long_number in compact
+
+
+def test_normalize_number_e164_fast_path_matches_parser():
+    assert _fast_e164('+14155552671') == '+14155552671'
+    # trunk prefixes and unknown country codes still go through phonenumbers
+    assert _fast_e164('+4402079460958') is None
+    assert normalize_number('+4402079460958') == '+442079460958'
+    assert _fast_e164('+9991234567') is None
+    assert normalize_number('+1 415 555 2671') == '+14155552671'
+
+
+def test_fast_normalize_common_shapes():
+    assert _fast_normalize('(415) 555-2671', 'US') == '+14155552671'
+    assert _fast_normalize('1-415-555-2671', 'CA') == '+14155552671'
+    assert _fast_normalize('+44 20 7946 0958', 'US') == '+442079460958'
+    # anything unusual is left to phonenumbers
+    assert _fast_normalize('020 7946 0958', 'GB') is None
+    assert _fast_normalize('415 555 2671 ext. 9', 'US') is None
+
+
+def test_normalize_number_skips_parser_for_nanp_digits():
+    before = _parse_cached.cache_info()
+    assert normalize_number('(650) 253-0000', 'US') == '+16502530000'
+    after = _parse_cached.cache_info()
+    assert (after.hits, after.misses) == (before.hits, before.misses)
+
+
+def test_find_name_streaming():
+    path = os.path.join(os.path.dirname(__file__), '..', 'sample_contacts.csv')
+    batches = list(iter_contacts_csv(path, batch_size=3))
+    assert [len(batch) for batch in batches] == [3, 1]
+    assert find_name_streaming('+255 782 292 070', path, batch_size=3) == 'Mum'
+    assert find_name_streaming('+1 202 555 0199', path) is None
+
+
+def test_find_name_streaming_last_duplicate_wins_across_batches(tmp_path):
+    rows = ["Old Name,+1 415 555 2671"] + [f"Filler {i},+1 202 555 {i:04d}" for i in range(20)] + ["New Name,(415) 555-2671"]
+    path = tmp_path / "dupes.csv"
+    path.write_text("name,phone\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    assert load_contacts_csv(str(path))['+14155552671'] == 'New Name'
+    for batch_size in (10, 10_000):
+        assert find_name_streaming('+1 415 555 2671', str(path), batch_size=batch_size) == 'New Name'
+
+
+def test_load_contacts_csv_column_order_and_short_rows():
+    content = "id,phone,name\n1,+1 415 555 2671,Test Person\n2,+1 202 555 0136\n3,,Nobody\n"
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8') as tf:
+        tf.write(content)
+        path = tf.name
+
+    try:
+        assert load_contacts_csv(path, default_region='US') == {'+14155552671': 'Test Person'}
+        assert load_contacts_csv(path, name_column='full_name', default_region='US') == {}
+    finally:
+        try:
+            os.unlink(path)
+        except Exception:
+            pass
+
+
+def test_normalize_chunk_handles_newline_in_phone_field():
+    rows = [("+1 415 555 2671", "A"), ("(202)\n555-0136", "B"), ("not a number", "C"), ("202-555-0136", "D")]
+    assert _normalize_chunk(rows, "US") == [("+14155552671", "A"), ("+12025550136", "D")]
+
+
+def test_normalize_chunk_drops_digitless_rows_without_parsing():
+    before = _parse_cached.cache_info()
+    assert _normalize_chunk([("N/A", "A"), ("ext. 5", "B"), ("1-800-FLOWERS", "C")], "US") == [("+18003569377", "C")]
+    after = _parse_cached.cache_info()
+    assert after.hits + after.misses == before.hits + before.misses + 1
+
+
+def test_normalize_chunk_shares_repeated_names():
+    rows = [("+1 415 555 2671", "".join(["Acme", " Corp"])), ("+1 202 555 0136", "".join(["Acme", " Corp"]))]
+    (_, first), (_, second) = _normalize_chunk(rows, "US")
+    assert first is second
+
+
+def test_load_contacts_csv_shares_names_across_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(lookup, "_CHUNK_ROWS", 2)
+    path = tmp_path / "repeats.csv"
+    path.write_text("name,phone\n" + "".join(f"Acme Corp,+1 415 555 {i:04d}\n" for i in range(6)), encoding="utf-8")
+    names = list(load_contacts_csv(str(path)).values())
+    assert len(names) == 6
+    assert all(name is names[0] for name in names)
+
+
+def test_normalize_number_caches_failures():
+    _parse_cached.cache_clear()
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            normalize_number('not a number', 'US')
+    info = _parse_cached.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_external_lookup_remembers_misses_in_memory(monkeypatch, fake_response):
+    calls = []
+
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    ext = ExternalLookup()
+    monkeypatch.setattr(ext, "_get", lambda url, **kwargs: calls.append(url) or fake_response({"businesses": []}))
+
+    assert ext.lookup_yelp('+1 415 555 2671') == (True, None)
+    assert ext.lookup_yelp('+1 415 555 2671') == (True, None)
+    assert len(calls) == 1
+
+
+def test_load_contacts_csv_pyarrow_engine_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = os.path.join(os.path.dirname(__file__), "..", "sample_contacts.csv")
+    assert load_contacts_csv(path, engine="pyarrow") == load_contacts_csv(path)
+
+    multiline = tmp_path / "multiline.csv"
+    multiline.write_text('name,phone\n"Acme\nCorp",+1 415 555 2671\nBob,+1 202 555 0136\n', encoding="utf-8")
+    assert load_contacts_csv(str(multiline), engine="pyarrow") == load_contacts_csv(str(multiline))
+
+
+def test_load_contacts_csv_pyarrow_engine_requires_pyarrow(monkeypatch):
+    # a None entry makes the import fail whether or not pyarrow is installed
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    path = os.path.join(os.path.dirname(__file__), "..", "sample_contacts.csv")
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        load_contacts_csv(path, engine="pyarrow")
+
+
+def test_load_contacts_csv_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        load_contacts_csv("contacts.csv", engine="pandas")
+
+
+def test_load_contacts_csv_mmap_engine_matches_csv(tmp_path):
+    path = os.path.join(os.path.dirname(__file__), "..", "sample_contacts.csv")
+    assert load_contacts_csv(path, engine="mmap") == load_contacts_csv(path)
+
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    assert load_contacts_csv(str(empty), engine="mmap") == {}
+
+    # CR-only and CRLF line endings, plus a quoted name spanning lines
+    for newline in (b"\r", b"\r\n"):
+        mixed = tmp_path / "newlines.csv"
+        mixed.write_bytes(newline.join([b"name,phone", b'"Acme' + newline + b'Corp",+14155552671', b"Bob,+1 202 555 0136", b""]))
+        assert load_contacts_csv(str(mixed), engine="mmap") == load_contacts_csv(str(mixed))
+        assert len(load_contacts_csv(str(mixed), engine="mmap")) == 2
+
+
+def test_load_contacts_csv_tolerates_invalid_utf8(tmp_path):
+    path = tmp_path / "latin1.csv"
+    path.write_bytes(b"name,phone\nJos\xe9 Garc\xeda,+1 415 555 2671\nTest Person,+1 202 555 0136\n")
+    for engine in ("csv", "mmap"):
+        contacts = load_contacts_csv(str(path), engine=engine)
+        assert contacts == {'+14155552671': 'Jos\ufffd Garc\ufffda', '+12025550136': 'Test Person'}
+
+
+def test_new_session_bounds_retries():
+    retry = _new_session().get_adapter("https://api.yelp.com").max_retries
+    assert (retry.connect, retry.read) == (1, 0)
+    # status retries happen in ExternalLookup._get, behind the rate limiter
+    assert not retry.status_forcelist
+
+
+def test_external_lookup_retries_through_rate_limiter(monkeypatch, fake_response):
+    class FakeSession:
+        def __init__(self, responses):
+            self.responses = list(responses)
+
+        def get(self, url, **kwargs):
+            return self.responses.pop(0)
+
+    class CountingLimiter:
+        calls = 0
+
+        def acquire(self):
+            CountingLimiter.calls += 1
+
+    monkeypatch.setattr(lookup, "_limiter_for", lambda host: CountingLimiter())
+    ext = lookup.ExternalLookup()
+
+    # a short Retry-After is honoured and every attempt goes through the limiter
+    ext._session = FakeSession([
+        fake_response(status_code=429, headers={"Retry-After": "0"}),
+        fake_response(status_code=503),
+        fake_response(status_code=200),
+    ])
+    assert ext._get("https://api.yelp.com/v3").status_code == 200
+    assert CountingLimiter.calls == 3
+
+    # a long Retry-After ends the attempt instead of retrying early
+    CountingLimiter.calls = 0
+    ext._session = FakeSession([fake_response(status_code=429, headers={"Retry-After": "120"}), fake_response(status_code=200)])
+    assert ext._get("https://api.yelp.com/v3").status_code == 429
+    assert CountingLimiter.calls == 1
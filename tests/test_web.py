@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+from phone_finder import web
+from phone_finder.lookup import ExternalLookup
+from phone_finder.web import create_app
+
+
+def test_index_reloads_contacts_when_file_changes():
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8') as tf:
+        tf.write("name,phone\nTest Person,+1 415 555 2671\n")
+        path = tf.name
+
+    try:
+        app = create_app({"CONTACTS_PATH": path, "DEFAULT_REGION": "US"})
+        client = app.test_client()
+        resp = client.post("/", data={"number": "+1 415 555 2671"})
+        assert b"Test Person" in resp.data
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("name,phone\nRenamed Person,+1 415 555 2671\n")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        resp = client.post("/", data={"number": "+1 415 555 2671"})
+        assert b"Renamed Person" in resp.data
+    finally:
+        try:
+            os.unlink(path)
+        except Exception:
+            pass
+
+
+def test_index_shows_numverify_result_as_hint(monkeypatch):
+    monkeypatch.setattr(ExternalLookup, "lookup_all", lambda self, number, default_region="US", providers=None: ("numverify", True, "carrier=Test Mobile"))
+    app = create_app({"CONTACTS_PATH": "", "DEFAULT_REGION": "US"})
+    resp = app.test_client().post("/", data={"number": "+1 415 555 2671"})
+    assert b"External hint: carrier=Test Mobile" in resp.data
+    assert b"Found:" not in resp.data
+
+
+def test_index_rejects_blank_number_without_loading_contacts(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("contacts should not be loaded")
+
+    monkeypatch.setattr(web, "_load_contacts", fail)
+    app = create_app({"CONTACTS_PATH": "contacts.csv", "DEFAULT_REGION": "US"})
+    resp = app.test_client().post("/", data={"number": "   "})
+    assert b"Enter a number" in resp.data
+
+
+def test_load_contacts_keeps_one_copy_per_file(tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text("name,phone\nTest Person,+1 415 555 2671\n", encoding="utf-8")
+    first = web._load_contacts(str(path), "US")
+    assert web._load_contacts(str(path), "US") is first
+
+    path.write_text("name,phone\nRenamed Person,+1 415 555 2671\nOther,+1 202 555 0136\n", encoding="utf-8")
+    assert web._load_contacts(str(path), "US")['+14155552671'] == 'Renamed Person'
+    assert [key for key in web._contacts_cache if key[0] == str(path)] == [(str(path), "US")]
+
+
+def test_index_only_bills_paid_providers_when_free_ones_miss(monkeypatch, fake_response):
+    calls = []
+    responses = {
+        "api.yelp.com": {"businesses": [{"name": "Test Cafe"}]},
+        "lookups.twilio.com": {"caller_name": {"caller_name": "Jane Doe"}},
+    }
+
+    def fake_get(self, url, **kwargs):
+        host = url.split("/")[2]
+        calls.append(host)
+        return fake_response(responses[host])
+
+    monkeypatch.setattr(ExternalLookup, "_get", fake_get)
+    monkeypatch.setenv("YELP_API_KEY", "test-key")
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "sid")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "token")
+    monkeypatch.delenv("NUMVERIFY_API_KEY", raising=False)
+    monkeypatch.delenv("OPENCORPORATES_API_KEY", raising=False)
+    client = create_app({"CONTACTS_PATH": "", "DEFAULT_REGION": "US"}).test_client()
+
+    assert b"Test Cafe" in client.post("/", data={"number": "+1 415 555 2671"}).data
+    assert calls == ["api.yelp.com"]
+
+    calls.clear()
+    responses["api.yelp.com"] = {"businesses": []}
+    assert b"Jane Doe" in client.post("/", data={"number": "+1 202 555 0136"}).data
+    assert calls == ["api.yelp.com", "lookups.twilio.com"]